@@ -20,12 +20,13 @@ if app:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 from google.auth.exceptions import DefaultCredentialsError  # type: ignore
-from google.cloud.firestore import Client  # type: ignore
+from google.cloud.firestore_v1.bulk_writer import BulkRetry, BulkWriteFailure, BulkWriter, BulkWriterOptions  # type: ignore
 
 from .utils import Job
 
@@ -38,6 +39,9 @@ except ImportError:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+# Matches the BulkWriter default; failures past this are logged and dropped.
+MAX_WRITE_ATTEMPTS = 15
+
 
 def init_firebase(credential_path: Optional[str] = None) -> Optional[firestore.Client]:
     """Initialise Firebase using a service account JSON key.
@@ -77,23 +81,57 @@ def init_firebase(credential_path: Optional[str] = None) -> Optional[firestore.C
         return None
 
 
+def job_doc_id(url: str) -> str:
+    """Return the Firestore document ID for a job URL.
+
+    The ID is a 24-character BLAKE2b hex digest of the URL.  It is stable
+    across runs, so re-scraped jobs overwrite their existing document,
+    and it is much shorter than the URL, which keeps batch payloads small.
+    """
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _on_write_error(failure: BulkWriteFailure, bulk_writer: BulkWriter) -> bool:
+    """Retry a failed write until ``MAX_WRITE_ATTEMPTS``, then log it."""
+    if failure.attempts < MAX_WRITE_ATTEMPTS:
+        return True
+    LOGGER.error(
+        "Giving up on Firestore write after %d attempts: %s", failure.attempts, failure.message
+    )
+    return False
+
+
 def upsert_jobs_batch(
     jobs: Iterable[Job],
     collection: str = "jobs",
     client: Optional[firestore.Client] = None,
-    batch_size: int = 400
 ) -> int:
-    """Batch write jobs to Firestore for improved efficiency."""
+    """Bulk write jobs to Firestore for improved efficiency.
+
+    Uses the SDK's `BulkWriter`, which batches writes, commits the
+    batches in parallel, ramps throughput up gradually and retries
+    failed writes on its own.  Writes still failing after
+    ``MAX_WRITE_ATTEMPTS`` are dropped, so the returned count only
+    includes writes Firestore acknowledged.
+    """
     if client is None:
         client = firestore.client()
 
-    batch = client.batch()
-    count, total = 0, 0
+    bulk_writer = client.bulk_writer(options=BulkWriterOptions(retry=BulkRetry.linear))
+    bulk_writer.on_write_error(_on_write_error)
+    # IDs of acknowledged writes; the callback runs on the writer's worker
+    # threads, where list.append is atomic
+    written: List[str] = []
+    bulk_writer.on_write_result(lambda reference, result, writer: written.append(reference.id))
+    # Resolved once rather than per job inside the loop
+    coll = client.collection(collection)
+    bulk_set = bulk_writer.set
+    queued = 0
 
     for job in jobs:
         if not job.url:
             continue
-        doc_id = job.url.replace("/", "_").replace(":", "_")
+        doc_id = job_doc_id(job.url)
         data = {
             "title": job.title,
             "company": job.company,
@@ -105,21 +143,20 @@ def upsert_jobs_batch(
             "average_salary": job.average_salary,
             "url": job.url,
             "source": job.source,
-            "logo": job.logo if hasattr(job, 'logo') else "",
+            "logo": job.logo,
         }
-        doc_ref = client.collection(collection).document(doc_id)
-        batch.set(doc_ref, data)
-        count += 1
-        total += 1
-
-        if count >= batch_size:
-            batch.commit()
-            LOGGER.info("Committed %d jobs to Firestore.", count)
-            batch = client.batch()
-            count = 0
-
-    if count > 0:
-        batch.commit()
-        LOGGER.info("Final commit: %d jobs.", count)
-
-    return total
\ No newline at end of file
+        bulk_set(coll.document(doc_id), data)
+        queued += 1
+
+    # Blocks until every queued write has been committed or given up on
+    bulk_writer.close()
+    dropped = queued - len(written)
+    if dropped:
+        LOGGER.error("Dropped %d of %d Firestore writes after retries.", dropped, queued)
+    LOGGER.info("Committed %d of %d queued jobs to Firestore.", len(written), queued)
+
+    return len(written)
+
+
+# Public name used by the pipeline and in the module docstring above.
+upsert_jobs = upsert_jobs_batch
@@ -13,16 +13,20 @@ Run `python main.py --help` for CLI usage.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import datetime as _dt
+import heapq
 import logging
 import os
 import signal
-import sys
-from typing import List, Optional
-
-import schedule
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import aiohttp
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -34,19 +38,36 @@ if __package__ is None or __package__ == "":
     parent_dir = _os.path.dirname(_os.path.abspath(__file__))
     _sys.path.append(parent_dir)
     __package__ = "job_scraper_production"
-from .firebase import init_firebase, upsert_jobs
 from .sources import (
-    fetch_adzuna_jobs,
-    fetch_remote_ok_jobs,
-    fetch_remotive_jobs,
+    fetch_adzuna_jobs_async,
+    fetch_remote_ok_jobs_async,
+    fetch_remotive_jobs_async,
 )
 from .utils import Job, to_local_date_str
 
+if TYPE_CHECKING:  # pragma: no cover
+    from google.cloud.firestore import Client
+
 
 LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
 
+# FAANG and leading Indian IT firms; override via the TOP_COMPANIES env var.
+DEFAULT_TOP_COMPANIES: List[str] = [
+    "Google",
+    "Amazon",
+    "Apple",
+    "Meta",
+    "Netflix",
+    "Microsoft",
+    "TCS",
+    "Infosys",
+    "Wipro",
+    "HCL",
+    "Tech Mahindra",
+]
+
 
 def load_top_companies(env_var: str = "TOP_COMPANIES") -> List[str]:
     value = os.environ.get(env_var)
@@ -55,6 +76,37 @@ def load_top_companies(env_var: str = "TOP_COMPANIES") -> List[str]:
     return [c.strip() for c in value.split(",") if c.strip()]
 
 
+async def _gather_all(
+    days: int,
+    min_salary: float,
+    limit: int,
+    top_companies: List[str],
+    sources: List[str],
+    search: str,
+) -> List[Job]:
+    """Fetch all requested sources concurrently over one shared HTTP session.
+
+    Each source runs as its own task; an exception in one task is logged
+    and the results of the remaining sources are still returned.
+    """
+    async with aiohttp.ClientSession() as session:
+        tasks = []
+        if "remoteok" in sources:
+            tasks.append(fetch_remote_ok_jobs_async(session, days=days, min_salary=min_salary, top_companies=top_companies, limit=limit))
+        if "remotive" in sources:
+            tasks.append(fetch_remotive_jobs_async(session, days=days, min_salary=min_salary, top_companies=top_companies, limit=limit, search=search))
+        if "adzuna" in sources:
+            tasks.append(fetch_adzuna_jobs_async(session, days=days, min_salary=min_salary, top_companies=top_companies, limit=limit, countries=None, what=search, where=None))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    jobs: List[Job] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            LOGGER.error("Source fetch failed: %s", result)
+            continue
+        jobs += result
+    return jobs
+
+
 def scrape_jobs(
     days: int,
     min_salary: float,
@@ -82,29 +134,37 @@ def scrape_jobs(
         top_companies = load_top_companies()
     if sources is None or not sources:
         sources = ["remoteok", "remotive", "adzuna"]
-    jobs: List[Job] = []
-    if "remoteok" in sources:
-        jobs += fetch_remote_ok_jobs(days=days, min_salary=min_salary, top_companies=top_companies, limit=limit)
-    if "remotive" in sources:
-        jobs += fetch_remotive_jobs(days=days, min_salary=min_salary, top_companies=top_companies, limit=limit, search=search)
-    if "adzuna" in sources:
-        jobs += fetch_adzuna_jobs(days=days, min_salary=min_salary, top_companies=top_companies, limit=limit, countries=None, what=search, where=None)
-    # Deduplicate by job URL
-    seen = set()
-    unique_jobs: List[Job] = []
+    jobs = asyncio.run(_gather_all(days, min_salary, limit, top_companies, sources, search))
+    # Deduplicate by job URL, keeping the first occurrence
+    by_url: Dict[str, Job] = {}
     for job in jobs:
-        if not job.url or job.url in seen:
-            continue
-        seen.add(job.url)
-        unique_jobs.append(job)
-    # Sort by average salary descending; fallback to recency if salary is missing
-    unique_jobs.sort(key=lambda j: (j.average_salary or 0.0, j.publication_date), reverse=True)
-    return unique_jobs[:limit]
+        if job.url and job.url not in by_url:
+            by_url[job.url] = job
+    # Sort by average salary descending; fallback to recency if salary is missing.
+    # Keys are computed once per job and only the top `limit` are kept.
+    keyed = [(job.average_salary or 0.0, job.publication_date, job) for job in by_url.values()]
+    top = heapq.nlargest(limit, keyed, key=itemgetter(0, 1))
+    return [job for _, _, job in top]
 
 
 def save_jobs_to_csv(jobs: List[Job], path: str) -> None:
     """Write jobs to a CSV file in a human‑readable format."""
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    rows = [
+        (
+            job.title,
+            job.company,
+            job.location,
+            to_local_date_str(job.publication_date),
+            job.salary_min,
+            job.salary_max,
+            job.currency,
+            job.average_salary,
+            job.url,
+            job.source,
+        )
+        for job in jobs
+    ]
+    with open(path, "w", newline="", encoding="utf-8", buffering=1024 * 1024) as f:
         writer = csv.writer(f)
         writer.writerow([
             "title",
@@ -118,19 +178,25 @@ def save_jobs_to_csv(jobs: List[Job], path: str) -> None:
             "url",
             "source",
         ])
-        for job in jobs:
-            writer.writerow([
-                job.title,
-                job.company,
-                job.location,
-                to_local_date_str(job.publication_date),
-                job.salary_min,
-                job.salary_max,
-                job.currency,
-                job.average_salary,
-                job.url,
-                job.source,
-            ])
+        writer.writerows(rows)
+
+
+def _save_csv(jobs: List[Job], path: str) -> None:
+    """Save jobs to ``path`` and log where they went."""
+    save_jobs_to_csv(jobs, path)
+    LOGGER.info("Saved jobs to %s", path)
+
+
+def _push_firebase(jobs: List[Job], client: Optional[Client] = None) -> None:
+    """Upsert jobs into Firestore, initialising Firebase unless ``client`` is given."""
+    # Imported here so runs without Firebase skip loading gRPC/protobuf
+    from .firebase import init_firebase, upsert_jobs
+
+    if client is None:
+        client = init_firebase()
+    if client:
+        inserted = upsert_jobs(jobs, collection=os.environ.get("FIRESTORE_COLLECTION", "jobs"), client=client)
+        LOGGER.info("Upserted %d jobs into Firebase", inserted)
 
 
 def run_pipeline(
@@ -142,8 +208,13 @@ def run_pipeline(
     push_firebase: bool,
     sources: Optional[List[str]],
     search: str,
+    client: Optional[Client] = None,
 ) -> None:
-    """Execute the scraping workflow: fetch, save locally, push to Firebase."""
+    """Execute the scraping workflow: fetch, save locally, push to Firebase.
+
+    ``client`` is an optional, already initialised Firestore client; pass
+    one to reuse its connection and credentials across runs.
+    """
     LOGGER.info(
         "Running job scraping pipeline (days=%d, min_salary=%s, limit=%d) with sources=%s",
         days,
@@ -153,38 +224,51 @@ def run_pipeline(
     )
     jobs = scrape_jobs(days=days, min_salary=min_salary, limit=limit, top_companies=top_companies, sources=sources, search=search)
     LOGGER.info("Fetched %d jobs", len(jobs))
-    if output_path:
-        save_jobs_to_csv(jobs, output_path)
-        LOGGER.info("Saved jobs to %s", output_path)
-    if push_firebase:
-        client = init_firebase()
-        if client:
-            inserted = upsert_jobs(jobs, collection=os.environ.get("FIRESTORE_COLLECTION", "jobs"), client=client)
-            LOGGER.info("Upserted %d jobs into Firebase", inserted)
+    # The CSV export (local disk) and the Firebase push (network) are
+    # independent, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = []
+        if output_path:
+            futures.append(executor.submit(_save_csv, jobs, output_path))
+        if push_firebase:
+            futures.append(executor.submit(_push_firebase, jobs, client))
+        for future in futures:
+            future.result()
 
 
 def schedule_pipeline(
     interval_hours: int,
     **kwargs,
 ) -> None:
-    """Schedule the pipeline to run at a fixed hourly interval."""
-    def job_wrapper():
-        try:
-            run_pipeline(**kwargs)
-        except Exception as exc:
-            LOGGER.exception("Error during scheduled scraping: %s", exc)
-    schedule.every(interval_hours).hours.do(job_wrapper)
-    LOGGER.info("Scheduled pipeline every %d hours", interval_hours)
-    # Keep the scheduler running until interrupted
+    """Run the pipeline now and then every ``interval_hours`` until stopped.
+
+    The process sleeps until the next run is due instead of polling, and
+    SIGINT/SIGTERM wake it immediately.  A run in progress is allowed to
+    finish before the scheduler exits.
+    """
+    interval = interval_hours * 3600
+    stop = threading.Event()
+    # Create the Firestore client once; it keeps its gRPC channel and
+    # OAuth token warm between runs.
+    if kwargs.get("push_firebase") and kwargs.get("client") is None:
+        from .firebase import init_firebase
+
+        kwargs["client"] = init_firebase()
+
     def handle_exit(signum, frame):
         LOGGER.info("Received signal %s, shutting down scheduler", signum)
-        sys.exit(0)
+        stop.set()
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
-    while True:
-        schedule.run_pending()
-        # Sleep for a minute between checks
-        time.sleep(60)
+    LOGGER.info("Scheduled pipeline every %d hours", interval_hours)
+    while not stop.is_set():
+        next_run = time.monotonic() + interval
+        try:
+            run_pipeline(**kwargs)
+        except Exception as exc:
+            LOGGER.exception("Error during scheduled scraping: %s", exc)
+        # Measured on the monotonic clock so runs stay `interval` apart
+        stop.wait(max(0.0, next_run - time.monotonic()))
 
 
 def main_cli(argv: Optional[List[str]] = None) -> None:
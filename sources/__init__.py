@@ -1,28 +1,41 @@
 """Job source modules.
 
 This package contains individual modules for each job API or website you
-wish to scrape.  Each module exposes a single function:
+wish to scrape.  Each module exposes a synchronous and an asynchronous
+fetcher:
 
 ```
 def fetch_jobs(days: int, min_salary: float, top_companies: List[str], limit: int) -> List[Job]:
     ...
+
+async def fetch_jobs_async(session: aiohttp.ClientSession, days: int, ...) -> List[Job]:
+    ...
 ```
 
-The function should return a list of `Job` objects defined in
+Both functions should return a list of `Job` objects defined in
 `job_scraper_production.utils`.  It should handle its own API errors and
-network issues gracefully, returning an empty list on failure.
+network issues gracefully, returning an empty list on failure.  The
+asynchronous variant takes the same arguments plus a caller-owned
+`aiohttp.ClientSession` so that the pipeline can fetch every source
+concurrently over a single connection pool.
 
 To add a new source, create a new module in this directory and ensure
-that its `fetch_jobs` function is imported in this package’s
-`__all__` list.
+that its `fetch_jobs` and `fetch_jobs_async` functions are imported in
+this package’s `__all__` list.
 """
 
 from .remote_ok import fetch_jobs as fetch_remote_ok_jobs  # noqa: F401
 from .remotive import fetch_jobs as fetch_remotive_jobs  # noqa: F401
 from .adzuna import fetch_jobs as fetch_adzuna_jobs  # noqa: F401
+from .remote_ok import fetch_jobs_async as fetch_remote_ok_jobs_async  # noqa: F401
+from .remotive import fetch_jobs_async as fetch_remotive_jobs_async  # noqa: F401
+from .adzuna import fetch_jobs_async as fetch_adzuna_jobs_async  # noqa: F401
 
 __all__ = [
     "fetch_remote_ok_jobs",
     "fetch_remotive_jobs",
     "fetch_adzuna_jobs",
+    "fetch_remote_ok_jobs_async",
+    "fetch_remotive_jobs_async",
+    "fetch_adzuna_jobs_async",
 ]
\ No newline at end of file
@@ -4,8 +4,8 @@ Adzuna exposes a RESTful API for job advertisements.  To use this module
 you must supply an ``app_id`` and ``app_key`` via environment
 variables or function arguments.  Each request must specify a country
 code (e.g. ``gb`` for the UK, ``us`` for the US, ``in`` for India) and
-an endpoint page number; we always fetch page 1 and limit the number
-of results via ``results_per_page``.  Example call:
+an endpoint page number.  A page holds at most 50 results, so we fetch
+as many pages as ``limit`` requires.  Example call:
 
 ```
 https://api.adzuna.com/v1/api/jobs/gb/search/1?app_id=XXX&app_key=YYY&results_per_page=20&sort_by=salary&salary_min=50000
@@ -20,20 +20,33 @@ Query parameters of interest:
 * ``salary_min``: minimum salary to filter on【268901123310661†L73-L85】.
 
 See the Adzuna API documentation for more options.  This module only
-supports simple filtering and does not implement pagination beyond the
-first page.
+supports simple filtering.
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
+import heapq
 import logging
+import math
 import os
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
+import aiohttp
 import requests
 
-from ..utils import Job, is_recent, is_top_company
+from ..utils import (
+    Job,
+    compute_average_salary,
+    default_http_session,
+    get_with_retries,
+    loads_json,
+    parse_iso_datetime,
+    recent_cutoff,
+    salary_sort_key,
+    top_company_matcher,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -41,6 +54,12 @@ LOGGER = logging.getLogger(__name__)
 
 ADZUNA_API_BASE = "https://api.adzuna.com/v1/api/jobs"
 
+# Adzuna returns at most this many results per page
+PAGE_SIZE = 50
+
+# Upper bound on concurrent requests to respect Adzuna's rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
 
 def _get_credentials() -> tuple[Optional[str], Optional[str]]:
     """Return (app_id, app_key) from environment variables.
@@ -57,6 +76,85 @@ def _get_credentials() -> tuple[Optional[str], Optional[str]]:
     return app_id, app_key
 
 
+def _build_params(
+    app_id: str,
+    app_key: str,
+    min_salary: float,
+    limit: int,
+    what: str,
+    where: Optional[str],
+) -> dict:
+    """Build the query parameters shared by every country request."""
+    params = {
+        "app_id": app_id,
+        "app_key": app_key,
+        "results_per_page": min(limit, PAGE_SIZE),
+        "content-type": "application/json",
+        # sort by salary descending to find high-paying roles
+        "sort_by": "salary",
+    }
+    if what:
+        params["what"] = what
+    if where:
+        params["where"] = where
+    # Adzuna accepts salary_min only if we specify currency; leave as min_salary for filter
+    if min_salary > 0:
+        params["salary_min"] = int(min_salary)
+    return params
+
+
+def _filter_items(
+    items: List[dict],
+    cutoff: _dt.datetime,
+    min_salary: float,
+    is_top: Optional[Callable[[str], bool]],
+) -> List[Job]:
+    """Filter the raw results of one page and convert them into `Job` objects.
+
+    Called once per country and page, so the caller builds the recency
+    ``cutoff`` and the ``is_top`` matcher once per fetch and passes them in.
+    """
+    jobs: List[Job] = []
+    for item in items:
+        # Parse publication date; Adzuna uses 'created' in ISO format
+        date_str = item.get("created") or ""
+        try:
+            published = parse_iso_datetime(date_str)
+        except Exception:
+            continue
+        if published < cutoff:
+            continue
+        # Company filter
+        company = item.get("company", {}).get("display_name", "N/A")
+        if is_top and not is_top(company):
+            continue
+        # Salaries in Adzuna are numeric and may be missing
+        salary_min_val = item.get("salary_min")
+        salary_max_val = item.get("salary_max")
+        avg_salary = compute_average_salary(salary_min_val, salary_max_val)
+        if avg_salary is None and min_salary > 0:
+            continue
+        if avg_salary is not None and avg_salary < min_salary:
+            continue
+        location = item.get("location", {}).get("display_name", "")
+        url = item.get("redirect_url", "")
+        currency = item.get("salary_currency")
+        job = Job(
+            title=item.get("title", ""),
+            company=company,
+            location=location,
+            publication_date=published,
+            salary_min=float(salary_min_val) if salary_min_val is not None else None,
+            salary_max=float(salary_max_val) if salary_max_val is not None else None,
+            currency=currency,
+            url=url,
+            source="Adzuna",
+            average_salary=avg_salary,
+        )
+        jobs.append(job)
+    return jobs
+
+
 def fetch_jobs(
     days: int = 7,
     min_salary: float = 0.0,
@@ -65,6 +163,7 @@ def fetch_jobs(
     countries: Optional[List[str]] = None,
     what: str = "",
     where: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> List[Job]:
     """Fetch jobs from Adzuna across one or more countries.
 
@@ -79,6 +178,8 @@ def fetch_jobs(
         what: Search keywords to narrow results (e.g. "software engineer").
         where: Optional location string to include jobs only from a specific
             city or region.
+        session: Optional `requests.Session` to reuse; defaults to the
+            module's shared session.
 
     Returns:
         List of `Job` objects.
@@ -88,86 +189,122 @@ def fetch_jobs(
         return []
     if countries is None:
         countries = ["us", "gb", "in"]
+    params = _build_params(app_id, app_key, min_salary, limit, what, where)
+    pages = math.ceil(limit / PAGE_SIZE)
+    cutoff = recent_cutoff(days)
+    is_top = top_company_matcher(top_companies) if top_companies else None
+    session = session or default_http_session()
     results: List[Job] = []
     for country in countries:
-        endpoint = f"{ADZUNA_API_BASE}/{country}/search/1"
-        params = {
-            "app_id": app_id,
-            "app_key": app_key,
-            "results_per_page": min(limit, 50),  # Adzuna max is 50 per page
-            "content-type": "application/json",
-            # sort by salary descending to find high-paying roles
-            "sort_by": "salary",
-        }
-        if what:
-            params["what"] = what
-        if where:
-            params["where"] = where
-        # Adzuna accepts salary_min only if we specify currency; leave as min_salary for filter
-        if min_salary > 0:
-            params["salary_min"] = int(min_salary)
-        try:
-            resp = requests.get(endpoint, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            items = data.get("results", [])
-        except Exception as exc:
-            LOGGER.error("Error fetching Adzuna jobs for %s: %s", country, exc)
-            continue
-        for item in items:
-            # Parse publication date; Adzuna uses 'created' in ISO format
-            date_str = item.get("created") or ""
+        for page in range(1, pages + 1):
+            endpoint = f"{ADZUNA_API_BASE}/{country}/search/{page}"
             try:
-                published = _dt.datetime.fromisoformat(date_str)
-            except Exception:
-                continue
-            dummy_job = Job(
-                title="",
-                company="",
-                location="",
-                publication_date=published,
-                salary_min=None,
-                salary_max=None,
-                currency=None,
-                url="",
-                source="Adzuna",
-            )
-            if not is_recent(dummy_job, days):
-                continue
-            # Company filter
-            company = item.get("company", {}).get("display_name", "N/A")
-            if top_companies:
-                dummy_job.company = company
-                if not is_top_company(dummy_job, top_companies):
-                    continue
-            # Salaries in Adzuna are numeric and may be missing
-            salary_min_val = item.get("salary_min")
-            salary_max_val = item.get("salary_max")
-            avg_salary: Optional[float] = None
-            if salary_min_val is not None and salary_max_val is not None:
-                avg_salary = (salary_min_val + salary_max_val) / 2.0
-            elif salary_max_val is not None:
-                avg_salary = float(salary_max_val)
-            elif salary_min_val is not None:
-                avg_salary = float(salary_min_val)
-            if avg_salary is None and min_salary > 0:
-                continue
-            if avg_salary is not None and avg_salary < min_salary:
-                continue
-            location = item.get("location", {}).get("display_name", "")
-            url = item.get("redirect_url", "")
-            currency = item.get("salary_currency")
-            job = Job(
-                title=item.get("title", ""),
-                company=company,
-                location=location,
-                publication_date=published,
-                salary_min=float(salary_min_val) if salary_min_val is not None else None,
-                salary_max=float(salary_max_val) if salary_max_val is not None else None,
-                currency=currency,
-                url=url,
-                source="Adzuna",
-            )
-            results.append(job)
-    results.sort(key=lambda j: j.average_salary or 0.0, reverse=True)
-    return results[:limit]
\ No newline at end of file
+                resp = session.get(endpoint, params=params, timeout=30)
+                resp.raise_for_status()
+                data = loads_json(resp.content)
+                items = data.get("results", [])
+            except Exception as exc:
+                LOGGER.error("Error fetching Adzuna jobs for %s (page %d): %s", country, page, exc)
+                break
+            results += _filter_items(items, cutoff, min_salary, is_top)
+            # A short page means there are no further results
+            if len(items) < params["results_per_page"]:
+                break
+    return heapq.nlargest(limit, results, key=salary_sort_key)
+
+
+async def _fetch_page(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    country: str,
+    page: int,
+    params: dict,
+) -> dict:
+    """Fetch and decode one page of results for a single country."""
+    async with semaphore:
+        _, _, body = await get_with_retries(
+            session,
+            f"{ADZUNA_API_BASE}/{country}/search/{page}",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return loads_json(body)
+
+
+async def _fetch_pages(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    targets: List[Tuple[str, int]],
+    params: dict,
+) -> List[Tuple[str, dict]]:
+    """Fetch ``(country, page)`` targets concurrently.
+
+    A failed page is logged and left out, so it does not affect the
+    others.  Returns ``(country, decoded page)`` pairs in target order.
+    """
+    responses = await asyncio.gather(
+        *(_fetch_page(session, semaphore, country, page, params) for country, page in targets),
+        return_exceptions=True,
+    )
+    pages: List[Tuple[str, dict]] = []
+    for (country, page), data in zip(targets, responses):
+        if isinstance(data, BaseException):
+            LOGGER.error("Error fetching Adzuna jobs for %s (page %d): %s", country, page, data)
+            continue
+        pages.append((country, data))
+    return pages
+
+
+async def fetch_jobs_async(
+    session: aiohttp.ClientSession,
+    days: int = 7,
+    min_salary: float = 0.0,
+    top_companies: Optional[List[str]] = None,
+    limit: int = 50,
+    countries: Optional[List[str]] = None,
+    what: str = "",
+    where: Optional[str] = None,
+) -> List[Job]:
+    """Asynchronous variant of :func:`fetch_jobs` using a shared session.
+
+    The first page of every country is requested concurrently (bounded by
+    ``MAX_CONCURRENT_REQUESTS``).  Like the synchronous version, a country
+    whose first page comes back short has no further results, so only the
+    countries with a full first page fan out to their remaining pages,
+    never past the result count Adzuna reports.  A failed page is logged
+    and does not affect the others.
+
+    Args:
+        session: Open `aiohttp.ClientSession` owned by the caller.
+        days, min_salary, top_companies, limit, countries, what, where:
+            See :func:`fetch_jobs`.
+
+    Returns:
+        List of `Job` objects.
+    """
+    app_id, app_key = _get_credentials()
+    if not app_id or not app_key:
+        return []
+    if countries is None:
+        countries = ["us", "gb", "in"]
+    params = _build_params(app_id, app_key, min_salary, limit, what, where)
+    per_page = params["results_per_page"]
+    pages = math.ceil(limit / PAGE_SIZE)
+    cutoff = recent_cutoff(days)
+    is_top = top_company_matcher(top_companies) if top_companies else None
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results: List[Job] = []
+    remaining: List[Tuple[str, int]] = []
+    for country, data in await _fetch_pages(session, semaphore, [(c, 1) for c in countries], params):
+        items = data.get("results", [])
+        results += _filter_items(items, cutoff, min_salary, is_top)
+        if len(items) < per_page:
+            continue
+        last_page = pages
+        count = data.get("count")
+        if isinstance(count, int):
+            last_page = min(pages, math.ceil(count / per_page))
+        remaining += [(country, page) for page in range(2, last_page + 1)]
+    for _, data in await _fetch_pages(session, semaphore, remaining, params):
+        results += _filter_items(data.get("results", []), cutoff, min_salary, is_top)
+    return heapq.nlargest(limit, results, key=salary_sort_key)
@@ -15,14 +15,25 @@ publication date, salary and company before returning.
 
 from __future__ import annotations
 
-import datetime as _dt
+import heapq
 import logging
 import re
 from typing import List, Optional
 
+import aiohttp
 import requests
 
-from ..utils import Job, is_recent, is_top_company
+from ..utils import (
+    Job,
+    compute_average_salary,
+    default_http_session,
+    get_with_retries,
+    loads_json,
+    parse_iso_datetime,
+    recent_cutoff,
+    salary_sort_key,
+    top_company_matcher,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -30,6 +41,9 @@ LOGGER = logging.getLogger(__name__)
 
 REMOTE_OK_API_URL = "https://remoteok.com/api"
 
+# Dollar amounts such as "$80,000"; compiled once at import time
+_SALARY_RE = re.compile(r"\$([0-9][0-9,]*)")
+
 
 def _parse_salary(salary_text: str) -> tuple[Optional[float], Optional[float]]:
     """Extract numeric salary bounds from a salary string.
@@ -38,67 +52,44 @@ def _parse_salary(salary_text: str) -> tuple[Optional[float], Optional[float]]:
     This helper returns a `(min, max)` tuple of floats, or `(None, None)` if
     no numbers are found.
     """
-    matches = re.findall(r"\$([0-9,]+)", salary_text)
-    if not matches:
+    nums: List[float] = []
+    for match in _SALARY_RE.finditer(salary_text):
+        nums.append(float(match.group(1).replace(",", "")))
+        if len(nums) == 2:
+            return nums[0], nums[1]
+    if not nums:
         return None, None
-    nums = [float(s.replace(",", "")) for s in matches]
-    if len(nums) >= 2:
-        return nums[0], nums[1]
     # Single number: treat as max
     return None, nums[0]
 
 
-def fetch_jobs(
-    days: int = 7,
-    min_salary: float = 0.0,
-    top_companies: Optional[List[str]] = None,
-    limit: int = 50,
+def _filter_items(
+    items: List[dict],
+    days: int,
+    min_salary: float,
+    top_companies: Optional[List[str]],
+    limit: int,
 ) -> List[Job]:
-    """Fetch recent, high‑paying jobs from Remote OK.
+    """Filter raw Remote OK listings and convert them into `Job` objects.
 
-    Args:
-        days: Maximum age of the job posting in days.
-        min_salary: Minimum average salary required to include a job.
-        top_companies: Optional list of company names to prioritise.  If
-            provided, only jobs whose company appears in this list (case
-            insensitive) are returned.  If None or empty, all companies
-            meeting the salary criterion are considered.
-        limit: Maximum number of jobs to return.
-
-    Returns:
-        A list of `Job` objects sorted by descending average salary.
+    Shared by the synchronous and asynchronous fetchers so that both apply
+    exactly the same recency, salary and company rules.
     """
-    try:
-        resp = requests.get(REMOTE_OK_API_URL, timeout=30, headers={"Accept": "application/json"})
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as exc:
-        LOGGER.error("Failed to fetch Remote OK jobs: %s", exc)
-        return []
-    # First entry is legal notice; skip it
-    items = data[1:]
+    cutoff = recent_cutoff(days)
+    is_top = top_company_matcher(top_companies) if top_companies else None
     jobs: List[Job] = []
     for item in items:
         try:
             date_str = item.get("date") or item.get("publication_date") or ""
-            # Normalize ISO date (append timezone if missing)
-            date_norm = date_str.replace("Z", "+00:00")
-            published = _dt.datetime.fromisoformat(date_norm)
+            published = parse_iso_datetime(date_str)
         except Exception:
             continue
         # Filter by recency
-        dummy_job = Job(
-            title="",
-            company="",
-            location="",
-            publication_date=published,
-            salary_min=None,
-            salary_max=None,
-            currency=None,
-            url="",
-            source="Remote OK",
-        )
-        if not is_recent(dummy_job, days):
+        if published < cutoff:
+            continue
+        company = item.get("company", "N/A")
+        # Filter by top companies if provided; cheaper than parsing salaries
+        if is_top and not is_top(company):
             continue
         # Extract salary
         salary_min: Optional[float] = item.get("salary_min")
@@ -106,22 +97,10 @@ def fetch_jobs(
         if salary_min is None and salary_max is None:
             salary_text = item.get("salary") or ""
             salary_min, salary_max = _parse_salary(salary_text)
-        avg_salary: Optional[float] = None
-        if salary_min is not None and salary_max is not None:
-            avg_salary = (salary_min + salary_max) / 2.0
-        elif salary_max is not None:
-            avg_salary = salary_max
-        elif salary_min is not None:
-            avg_salary = salary_min
+        avg_salary = compute_average_salary(salary_min, salary_max)
         # Filter by salary threshold
         if avg_salary is None or avg_salary < min_salary:
             continue
-        company = item.get("company", "N/A")
-        # Filter by top companies if provided
-        if top_companies:
-            dummy_job.company = company
-            if not is_top_company(dummy_job, top_companies):
-                continue
         # Build Job object
         job = Job(
             title=item.get("position", ""),
@@ -133,8 +112,73 @@ def fetch_jobs(
             currency="USD",  # Remote OK salaries are typically in USD
             url=item.get("url", ""),
             source="Remote OK",
+            average_salary=avg_salary,
         )
         jobs.append(job)
-    # Sort by average salary descending
-    jobs.sort(key=lambda j: j.average_salary or 0.0, reverse=True)
-    return jobs[:limit]
\ No newline at end of file
+    # Keep the best-paid `limit` jobs, highest first
+    return heapq.nlargest(limit, jobs, key=salary_sort_key)
+
+
+def fetch_jobs(
+    days: int = 7,
+    min_salary: float = 0.0,
+    top_companies: Optional[List[str]] = None,
+    limit: int = 50,
+    session: Optional[requests.Session] = None,
+) -> List[Job]:
+    """Fetch recent, high‑paying jobs from Remote OK.
+
+    Args:
+        days: Maximum age of the job posting in days.
+        min_salary: Minimum average salary required to include a job.
+        top_companies: Optional list of company names to prioritise.  If
+            provided, only jobs whose company appears in this list (case
+            insensitive) are returned.  If None or empty, all companies
+            meeting the salary criterion are considered.
+        limit: Maximum number of jobs to return.
+        session: Optional `requests.Session` to reuse; defaults to the
+            module's shared session.
+
+    Returns:
+        A list of `Job` objects sorted by descending average salary.
+    """
+    try:
+        resp = (session or default_http_session()).get(REMOTE_OK_API_URL, timeout=30, headers={"Accept": "application/json"})
+        resp.raise_for_status()
+        data = loads_json(resp.content)
+    except Exception as exc:
+        LOGGER.error("Failed to fetch Remote OK jobs: %s", exc)
+        return []
+    # First entry is legal notice; skip it
+    return _filter_items(data[1:], days, min_salary, top_companies, limit)
+
+
+async def fetch_jobs_async(
+    session: aiohttp.ClientSession,
+    days: int = 7,
+    min_salary: float = 0.0,
+    top_companies: Optional[List[str]] = None,
+    limit: int = 50,
+) -> List[Job]:
+    """Asynchronous variant of :func:`fetch_jobs` using a shared session.
+
+    Args:
+        session: Open `aiohttp.ClientSession` owned by the caller.
+        days, min_salary, top_companies, limit: See :func:`fetch_jobs`.
+
+    Returns:
+        A list of `Job` objects sorted by descending average salary.
+    """
+    try:
+        _, _, body = await get_with_retries(
+            session,
+            REMOTE_OK_API_URL,
+            headers={"Accept": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        data = loads_json(body)
+    except Exception as exc:
+        LOGGER.error("Failed to fetch Remote OK jobs: %s", exc)
+        return []
+    # First entry is legal notice; skip it
+    return _filter_items(data[1:], days, min_salary, top_companies, limit)
\ No newline at end of file
@@ -16,18 +16,38 @@ Fields extracted:
   * ``url``: link to the job description.
 
 Jobs lacking salary information are retained only if `min_salary` is zero.
+
+Listings are cached per search term in ``CACHE_PATH`` (a small JSON file
+holding only the fields this module reads, for at most
+``MAX_CACHED_SEARCHES`` terms), so repeated runs within
+``CACHE_TTL_SECONDS`` (CI jobs, several profiles, GUI reruns) do not hit
+the API again, even from a new process.  Once stale, the cached copy is
+revalidated with its ETag, and it is still used if that refresh fails.
 """
 
 from __future__ import annotations
 
-import datetime as _dt
+import heapq
+import json
 import logging
+import os
 import re
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import aiohttp
 import requests
 
-from ..utils import Job, is_recent, is_top_company
+from ..utils import (
+    Job,
+    default_http_session,
+    get_with_retries,
+    loads_json,
+    parse_iso_datetime,
+    recent_cutoff,
+    top_company_matcher,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -35,35 +55,198 @@ LOGGER = logging.getLogger(__name__)
 
 REMOTIVE_API_URL = "https://remotive.com/api/remote-jobs"
 
+# Fetched listings persist here between runs; by default the working
+# directory, next to the CSV export
+CACHE_PATH = os.environ.get("REMOTIVE_CACHE_PATH", "remotive_cache.json")
+
+# Remotive asks for only a few requests per day.  Six hours caps repeated
+# runs (CI jobs, several profiles, GUI reruns) at four fetches a day;
+# runs on the default 12-hour schedule fall outside it and revalidate
+# with the ETag instead.
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Beyond this many search terms the least recently fetched is evicted
+MAX_CACHED_SEARCHES = 16
+
+# The only listing fields _filter_items reads; everything else, notably
+# the multi-megabyte HTML descriptions, is dropped before caching
+_CACHED_FIELDS = ("publication_date", "company_name", "title", "candidate_required_location", "salary", "url")
+
+# search term -> (fetch time in epoch seconds, ETag or None, trimmed
+# listings), oldest fetch first; read from CACHE_PATH on first use
+_CACHE: Optional[Dict[str, Tuple[float, Optional[str], List[dict]]]] = None
+
+# A number with optional commas/decimals, followed by an optional "k"
+# multiplier (e.g. "100,000" or "120k"); matched against lowercased text
+_NUM_RE = re.compile(r"([0-9][0-9,]*\.?[0-9]*)(k?)")
+
+
+def _load_cache() -> Dict[str, Tuple[float, Optional[str], List[dict]]]:
+    """Return the listing cache, reading it from ``CACHE_PATH`` on first use.
+
+    A missing file starts an empty cache; an unreadable one is logged and
+    ignored, since it only costs a fetch.
+    """
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = {}
+        try:
+            with open(CACHE_PATH, "rb") as f:
+                entries = loads_json(f.read())
+            for search, (fetched_at, etag, items) in entries.items():
+                _CACHE[search] = (fetched_at, etag, items)
+        except FileNotFoundError:
+            pass
+        except (OSError, AttributeError, TypeError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable Remotive cache %s: %s", CACHE_PATH, exc)
+            _CACHE = {}
+    return _CACHE
+
+
+def _save_cache(cache: Dict[str, Tuple[float, Optional[str], List[dict]]]) -> None:
+    """Write the cache to ``CACHE_PATH`` atomically; failures are only logged."""
+    tmp_path = f"{CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as exc:
+        LOGGER.warning("Could not write Remotive cache %s: %s", CACHE_PATH, exc)
+
+
+def _cache_lookup(search: str) -> Tuple[Optional[List[dict]], Dict[str, str]]:
+    """Return fresh cached listings, or the headers for a conditional GET."""
+    entry = _load_cache().get(search)
+    if entry is None:
+        return None, {}
+    fetched_at, etag, items = entry
+    if time.time() - fetched_at < CACHE_TTL_SECONDS:
+        return items, {}
+    return None, ({"If-None-Match": etag} if etag else {})
+
+
+def _cache_store(search: str, status: int, etag: Optional[str], raw: bytes) -> List[dict]:
+    """Record a response in the cache and return its trimmed listings.
+
+    A 304 reply revalidates the cached listings instead of decoding ``raw``.
+    """
+    cache = _load_cache()
+    if status == 304:
+        _, cached_etag, items = cache.pop(search)
+        etag = etag or cached_etag
+    else:
+        items = [
+            {key: item[key] for key in _CACHED_FIELDS if key in item}
+            for item in loads_json(raw).get("jobs", [])
+        ]
+        cache.pop(search, None)
+    cache[search] = (time.time(), etag, items)
+    while len(cache) > MAX_CACHED_SEARCHES:
+        del cache[next(iter(cache))]
+    _save_cache(cache)
+    return items
 
-def _parse_salary(salary_text: str) -> tuple[Optional[float], Optional[float]]:
-    """Parse numeric salary bounds from a salary string.
+
+def _cache_fallback(search: str) -> Optional[List[dict]]:
+    """Return the cached listings for ``search`` however stale, if any.
+
+    Used when a refresh fails so a brief outage does not drop the source.
+    """
+    entry = _load_cache().get(search)
+    return entry[2] if entry is not None else None
+
+
+# Salary strings repeat heavily across postings and fetches, and the
+# returned tuples are immutable, so results are safe to share
+@lru_cache(maxsize=2048)
+def _parse_salary(salary_text: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Parse numeric salary bounds and their average from a salary string.
 
     Remotive salaries may appear as "$100,000 – $150,000", "€60k",
     "100k-120k", or similar.  This helper extracts up to two numbers
     from the string and treats them as salary bounds.  Returns (min,
-    max) in whatever units appear in the string; caller is responsible
-    for currency conversion if needed.
+    max, average) in whatever units appear in the string; a lone number
+    is treated as the maximum.  Caller is responsible for currency
+    conversion if needed.
     """
-    # Extract numbers with optional commas and a trailing k (e.g. 100k)
-    matches = re.findall(r"([0-9][0-9,]*\.?[0-9]*)k?", salary_text.lower())
-    if not matches:
-        return None, None
-    nums: List[float] = []
-    for m in matches:
-        # Skip empty strings (can happen with ranges like "100k - 150k")
-        if not m:
-            continue
-        value = float(m.replace(",", ""))
-        # If 'k' was present in the original text after the number, multiply by 1,000
-        if re.search(rf"{re.escape(m)}k", salary_text.lower()):
+    # Most postings carry no salary at all; skip lowercasing and the regex
+    if not salary_text:
+        return None, None, None
+    first: Optional[float] = None
+    for match in _NUM_RE.finditer(salary_text.lower()):
+        number, k = match.groups()
+        value = float(number.replace(",", ""))
+        # A trailing 'k' means thousands
+        if k:
             value *= 1_000
-        nums.append(value)
-    if not nums:
-        return None, None
-    if len(nums) >= 2:
-        return nums[0], nums[1]
-    return None, nums[0]
+        if first is None:
+            first = value
+        else:
+            return first, value, (first + value) / 2.0
+    return None, first, first
+
+
+def _filter_items(
+    items: List[dict],
+    days: int,
+    min_salary: float,
+    top_companies: Optional[List[str]],
+    limit: int,
+) -> List[Job]:
+    """Filter raw Remotive listings and convert them into `Job` objects.
+
+    Shared by the synchronous and asynchronous fetchers so that both apply
+    exactly the same recency, salary and company rules.
+    """
+    if limit <= 0:
+        return []
+    cutoff = recent_cutoff(days)
+    is_top = top_company_matcher(top_companies) if top_companies else None
+    # Min-heap holding the best `limit` rows seen so far as (salary, -index,
+    # row).  The negated index makes earlier rows win ties, exactly like a
+    # stable descending sort, and keeps the row tuples from being compared.
+    heap: List[tuple] = []
+    for index, item in enumerate(items):
+        date_str = item.get("publication_date") or ""
+        try:
+            # Remotive timestamps carry no offset; they are parsed as UTC
+            published = parse_iso_datetime(date_str)
+        except (TypeError, ValueError):
+            continue
+        if published < cutoff:
+            continue
+        company = item.get("company_name", "N/A")
+        if is_top and not is_top(company):
+            continue
+        salary_min, salary_max, avg_salary = _parse_salary(item.get("salary", ""))
+        if avg_salary is None and min_salary > 0:
+            # Skip if salary is unknown and threshold is set
+            continue
+        if avg_salary is not None and avg_salary < min_salary:
+            continue
+        entry = (avg_salary or 0.0, -index, (item, published, company, salary_min, salary_max, avg_salary))
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    # Jobs are only built for the rows that made the cut
+    jobs: List[Job] = []
+    for _, _, (item, published, company, salary_min, salary_max, avg_salary) in sorted(heap, reverse=True):
+        jobs.append(
+            Job(
+                title=item.get("title", ""),
+                company=company,
+                location=item.get("candidate_required_location", "Remote"),
+                publication_date=published,
+                salary_min=salary_min,
+                salary_max=salary_max,
+                currency=None,
+                url=item.get("url", ""),
+                source="Remotive",
+                average_salary=avg_salary,
+            )
+        )
+    return jobs
 
 
 def fetch_jobs(
@@ -72,6 +255,7 @@ def fetch_jobs(
     top_companies: Optional[List[str]] = None,
     limit: int = 50,
     search: str = "",
+    session: Optional[requests.Session] = None,
 ) -> List[Job]:
     """Fetch recent jobs from the Remotive API.
 
@@ -82,6 +266,8 @@ def fetch_jobs(
         top_companies: Optional list of company names to restrict results.
         limit: Maximum number of jobs to return.
         search: Optional search term to narrow jobs (e.g. "engineer").
+        session: Optional `requests.Session` to reuse; defaults to the
+            module's shared session.
 
     Returns:
         List of `Job` objects.
@@ -89,66 +275,56 @@ def fetch_jobs(
     params = {}
     if search:
         params["search"] = search
-    try:
-        resp = requests.get(REMOTIVE_API_URL, params=params, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
-        items = data.get("jobs", [])
-    except Exception as exc:
-        LOGGER.error("Failed to fetch Remotive jobs: %s", exc)
-        return []
-    jobs: List[Job] = []
-    for item in items:
-        date_str = item.get("publication_date") or ""
+    items, headers = _cache_lookup(search)
+    if items is None:
         try:
-            published = _dt.datetime.fromisoformat(date_str)
-        except Exception:
-            continue
-        dummy_job = Job(
-            title="",
-            company="",
-            location="",
-            publication_date=published,
-            salary_min=None,
-            salary_max=None,
-            currency=None,
-            url="",
-            source="Remotive",
-        )
-        if not is_recent(dummy_job, days):
-            continue
-        company = item.get("company_name", "N/A")
-        if top_companies:
-            dummy_job.company = company
-            if not is_top_company(dummy_job, top_companies):
-                continue
-        salary_text = item.get("salary", "")
-        salary_min, salary_max = _parse_salary(salary_text)
-        avg_salary: Optional[float] = None
-        if salary_min is not None and salary_max is not None:
-            avg_salary = (salary_min + salary_max) / 2.0
-        elif salary_max is not None:
-            avg_salary = salary_max
-        elif salary_min is not None:
-            avg_salary = salary_min
-        if avg_salary is None and min_salary > 0:
-            # Skip if salary is unknown and threshold is set
-            continue
-        if avg_salary is not None and avg_salary < min_salary:
-            continue
-        location = item.get("candidate_required_location", "Remote")
-        url = item.get("url", "")
-        job = Job(
-            title=item.get("title", ""),
-            company=company,
-            location=location,
-            publication_date=published,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            currency=None,
-            url=url,
-            source="Remotive",
-        )
-        jobs.append(job)
-    jobs.sort(key=lambda j: j.average_salary or 0.0, reverse=True)
-    return jobs[:limit]
\ No newline at end of file
+            resp = (session or default_http_session()).get(REMOTIVE_API_URL, params=params, headers=headers, timeout=30)
+            resp.raise_for_status()
+            items = _cache_store(search, resp.status_code, resp.headers.get("ETag"), resp.content)
+        except Exception as exc:
+            items = _cache_fallback(search)
+            if items is None:
+                LOGGER.error("Failed to fetch Remotive jobs: %s", exc)
+                return []
+            LOGGER.warning("Failed to refresh Remotive jobs; using cached listings: %s", exc)
+    return _filter_items(items, days, min_salary, top_companies, limit)
+
+
+async def fetch_jobs_async(
+    session: aiohttp.ClientSession,
+    days: int = 7,
+    min_salary: float = 0.0,
+    top_companies: Optional[List[str]] = None,
+    limit: int = 50,
+    search: str = "",
+) -> List[Job]:
+    """Asynchronous variant of :func:`fetch_jobs` using a shared session.
+
+    Args:
+        session: Open `aiohttp.ClientSession` owned by the caller.
+        days, min_salary, top_companies, limit, search: See :func:`fetch_jobs`.
+
+    Returns:
+        List of `Job` objects.
+    """
+    params = {}
+    if search:
+        params["search"] = search
+    items, headers = _cache_lookup(search)
+    if items is None:
+        try:
+            status, resp_headers, body = await get_with_retries(
+                session,
+                REMOTIVE_API_URL,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            items = _cache_store(search, status, resp_headers.get("ETag"), body)
+        except Exception as exc:
+            items = _cache_fallback(search)
+            if items is None:
+                LOGGER.error("Failed to fetch Remotive jobs: %s", exc)
+                return []
+            LOGGER.warning("Failed to refresh Remotive jobs; using cached listings: %s", exc)
+    return _filter_items(items, days, min_salary, top_companies, limit)
\ No newline at end of file
@@ -3,19 +3,45 @@
 This module centralises shared data structures, type hints and filtering
 logic.  It defines a `Job` data class that serves as a common schema for
 all job sources, as well as helper functions for computing average salary
-and determining whether a job originates from a “top company”.
+and determining whether a job originates from a “top company”.  It also
+holds the HTTP and JSON plumbing the sources share: `loads_json` (orjson
+when installed), the pooled, retrying `requests` session factory and the
+retrying aiohttp GET used by the asynchronous fetchers.
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
+import email.utils
+import json
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
 
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
 from tzlocal import get_localzone
+from urllib3.util.retry import Retry
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore
 
-@dataclass
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+@dataclass(slots=True)
 class Job:
     """Represents a normalised job listing.
 
@@ -32,6 +58,11 @@ class Job:
         url: URL to the full job description.  Must link to the original
             posting on the source’s domain.
         source: The API/source used to fetch this job (e.g. "Remote OK").
+        logo: Optional URL of the company logo; empty if the source does
+            not provide one.
+        average_salary: Average of salary_min and salary_max, or whichever
+            bound is present; ``None`` if neither is.  Computed on
+            construction unless supplied by the source.
     """
 
     title: str
@@ -43,20 +74,82 @@ class Job:
     currency: Optional[str]
     url: str
     source: str
+    logo: str = ""
+    average_salary: Optional[float] = None
 
-    @property
-    def average_salary(self) -> Optional[float]:
-        """Compute the average of salary_min and salary_max.
+    def __post_init__(self) -> None:
+        """Fill in ``average_salary`` from the salary bounds if not given.
 
-        Returns:
-            The average salary if at least one salary bound is present,
-            otherwise ``None``.  Salaries are assumed to be annual and in
-            USD.  If currency conversions are required, convert before
-            populating salary_min/max.
+        The average is stored rather than recomputed on each access because
+        it is read for every sort comparison and every serialised row.
+        Salaries are assumed to be annual and in USD.  If currency
+        conversions are required, convert before populating
+        salary_min/max.
         """
-        if self.salary_min is not None and self.salary_max is not None:
-            return (self.salary_min + self.salary_max) / 2.0
-        return self.salary_max or self.salary_min
+        if self.average_salary is None:
+            self.average_salary = compute_average_salary(self.salary_min, self.salary_max)
+
+
+def compute_average_salary(salary_min: Optional[float], salary_max: Optional[float]) -> Optional[float]:
+    """Return the midpoint of two salary bounds, or whichever one is known.
+
+    Sources call this on raw values so they can filter on salary before
+    allocating a `Job`.  Returns ``None`` if both bounds are missing.
+    """
+    if salary_min is not None and salary_max is not None:
+        return (salary_min + salary_max) / 2.0
+    if salary_max is not None:
+        return float(salary_max)
+    if salary_min is not None:
+        return float(salary_min)
+    return None
+
+
+def salary_sort_key(job: Job) -> float:
+    """Sort key ranking jobs by average salary, unknown salaries last.
+
+    Sorting and `heapq.nlargest` evaluate this once per job, not once per
+    comparison.
+    """
+    return job.average_salary or 0.0
+
+
+def recent_cutoff(days: int) -> _dt.datetime:
+    """Return the oldest UTC publication time still considered recent.
+
+    Sources compute this once per fetch and compare each parsed
+    publication date against it, instead of calling :func:`is_recent`
+    (and reading the clock) for every listing.
+    """
+    return _dt.datetime.now(_dt.timezone.utc) - _dt.timedelta(days=days)
+
+
+def parse_iso_datetime(value: str) -> _dt.datetime:
+    """Parse an ISO 8601 timestamp into an aware datetime.
+
+    Uses the `ciso8601` C parser when it is installed, which also accepts
+    a trailing "Z" directly; otherwise falls back to
+    `datetime.fromisoformat`.  Timestamps without an offset are assumed to
+    be UTC so they can be compared with :func:`recent_cutoff`.
+
+    Raises:
+        TypeError: If ``value`` is not a string.
+        ValueError: If ``value`` is not a valid ISO 8601 timestamp.
+    """
+    if ciso8601 is not None:
+        parsed = ciso8601.parse_datetime(value)
+    elif isinstance(value, str):
+        parsed = _dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    else:
+        raise TypeError(f"expected an ISO 8601 string, got {type(value).__name__}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_dt.timezone.utc)
+    return parsed
+
+
+def is_recent_date(published: _dt.datetime, days: int) -> bool:
+    """Return True if ``published`` lies within the past ``days`` days."""
+    return published >= recent_cutoff(days)
 
 
 def is_recent(job: Job, days: int) -> bool:
@@ -70,9 +163,45 @@ def is_recent(job: Job, days: int) -> bool:
         True if the job’s `publication_date` is within the last ``days``
         relative to the current time in the local timezone.
     """
-    now = _dt.datetime.now(_dt.timezone.utc)
-    cutoff = now - _dt.timedelta(days=days)
-    return job.publication_date >= cutoff
+    return is_recent_date(job.publication_date, days)
+
+
+def normalise_top_companies(top_companies: Iterable[str]) -> Tuple[str, ...]:
+    """Strip and lowercase company names once, for use with :func:`is_top_company_name`."""
+    return tuple(tc.strip().lower() for tc in top_companies)
+
+
+def is_top_company_name(company: str, top_companies: Iterable[str]) -> bool:
+    """Return True if ``company`` matches one of the normalised top companies.
+
+    ``top_companies`` must already be normalised with
+    :func:`normalise_top_companies`, so that sources can prepare the list
+    once and check raw company names without building a `Job`.  Partial
+    matches are allowed, as in :func:`is_top_company`.
+    """
+    company_lower = company.lower()
+    return any(tc in company_lower for tc in top_companies)
+
+
+def top_company_matcher(top_companies: Iterable[str]) -> Callable[[str], bool]:
+    """Build a predicate telling whether a company name is a top company.
+
+    Names are normalised once, as in :func:`normalise_top_companies`, and
+    matched with the same partial, case‑insensitive rule.  When
+    `pyahocorasick` is installed the names are compiled into an
+    Aho‑Corasick automaton, so each check is a single pass over the
+    company name however many top companies there are; otherwise each
+    check falls back to :func:`is_top_company_name`.
+    """
+    tops = normalise_top_companies(top_companies)
+    # The automaton cannot hold an empty name, which matches everything
+    if ahocorasick is None or not tops or "" in tops:
+        return lambda company: is_top_company_name(company, tops)
+    automaton = ahocorasick.Automaton()
+    for tc in tops:
+        automaton.add_word(tc, tc)
+    automaton.make_automaton()
+    return lambda company: next(automaton.iter(company.lower()), None) is not None
 
 
 def is_top_company(job: Job, top_companies: List[str]) -> bool:
@@ -84,15 +213,126 @@ def is_top_company(job: Job, top_companies: List[str]) -> bool:
     """
     if not top_companies:
         return False
-    company_lower = job.company.lower()
-    return any(tc.strip().lower() in company_lower for tc in top_companies)
+    return is_top_company_name(job.company, normalise_top_companies(top_companies))
+
+
+@lru_cache(maxsize=None)
+def _local_timezone() -> _dt.tzinfo:
+    """Return the machine's timezone, looked up once per process.
+
+    tzlocal reads /etc/localtime (or the registry) on every call.  The
+    lookup is lazy rather than done at import so that a misconfigured
+    zone only fails the callers that format dates.
+    """
+    return get_localzone()  # type: ignore
 
 
 def to_local_date_str(dt_obj: _dt.datetime) -> str:
     """Convert an aware datetime to a local date string in ISO format.
 
     Useful for presenting dates in the UI.  The local timezone is
-    determined by tzlocal.get_localzone().
+    determined once per process by tzlocal.get_localzone().
+    """
+    return dt_obj.astimezone(_local_timezone()).strftime("%Y-%m-%d %H:%M")
+
+
+def loads_json(raw: bytes) -> Any:
+    """Decode a raw JSON response body.
+
+    Uses `orjson` when it is installed, which parses large API payloads
+    several times faster than the standard library, and falls back to
+    `json` otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Retry policy shared by the requests sessions and the aiohttp fetchers
+MAX_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF = 0.5
+# Statuses whose Retry-After header urllib3 honours; the aiohttp path caps
+# the requested wait so one response cannot stall the whole pipeline
+RETRY_AFTER_STATUSES = frozenset({413, 429, 503})
+MAX_RETRY_AFTER = 60.0
+
+
+def make_http_session() -> requests.Session:
+    """Create a `requests.Session` with connection pooling and retries.
+
+    Reusing a session keeps TCP/TLS connections alive between requests
+    to the same host (e.g. Adzuna's per-country calls), and transient
+    429/5xx responses are retried with backoff instead of failing the
+    whole source.
+    """
+    retries = Retry(
+        total=MAX_RETRIES,
+        status_forcelist=sorted(RETRY_STATUSES),
+        backoff_factor=RETRY_BACKOFF,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries))
+    return session
+
+
+@lru_cache(maxsize=None)
+def default_http_session() -> requests.Session:
+    """Return the session shared by the synchronous fetchers.
+
+    Created on first use rather than at import, so runs that only use the
+    aiohttp fetchers never build it.
+    """
+    return make_http_session()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into a delay capped at ``MAX_RETRY_AFTER``.
+
+    Accepts both forms the header allows, delta-seconds and an HTTP date;
+    returns ``None`` if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=_dt.timezone.utc)
+        delay = (when - _dt.datetime.now(_dt.timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+async def get_with_retries(
+    session: aiohttp.ClientSession, url: str, **kwargs: Any
+) -> Tuple[int, Mapping[str, str], bytes]:
+    """GET ``url`` on an aiohttp session with the same retries as the sync path.
+
+    Connection errors, timeouts and ``RETRY_STATUSES`` responses are
+    retried up to ``MAX_RETRIES`` times with exponential backoff; any other
+    error status raises `aiohttp.ClientResponseError` straight away.  As
+    with urllib3, a ``Retry-After`` header on a 413, 429 or 503 response
+    replaces the backoff, capped at ``MAX_RETRY_AFTER`` seconds.  Keyword
+    arguments are passed to `aiohttp.ClientSession.get`.
+
+    Returns:
+        The response status, headers and body.
     """
-    local_tz = get_localzone()  # type: ignore
-    return dt_obj.astimezone(local_tz).strftime("%Y-%m-%d %H:%M")
\ No newline at end of file
+    for attempt in range(MAX_RETRIES + 1):
+        delay: Optional[float] = None
+        try:
+            async with session.get(url, **kwargs) as resp:
+                if resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    resp.raise_for_status()
+                    return resp.status, resp.headers, await resp.read()
+                if resp.status in RETRY_AFTER_STATUSES:
+                    delay = _retry_after_seconds(resp.headers.get("Retry-After"))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * 2**attempt if delay is None else delay)
+    raise AssertionError("unreachable")  # pragma: no cover